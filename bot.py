@@ -1,15 +1,27 @@
 import asyncio
-import json
+import atexit
+import bisect
 import logging
+import logging.handlers
+import os
+import queue
 import re
 import sys
 import time
-from typing import Dict, Optional, Set
+from typing import Dict, Final, FrozenSet, Iterator, Optional, Set
 
+import aiohttp
 import discord
+import orjson
 from discord.ext import commands
 
+try:
+    import uvloop
+except ImportError:  # Not available on Windows - fall back to asyncio's loop
+    uvloop = None
+
 from config.settings import (
+    BOT_COLOR,
     CACHE_TIMEOUT,
     COMMAND_PREFIX,
     DISCORD_TOKEN,
@@ -21,59 +33,186 @@ from config.settings import (
     validate_settings,
 )
 from utils.constants import (
+    CACHE_SAVE_DEBOUNCE_SECONDS,
+    DISCORD_EMBED_DESCRIPTION_LIMIT,
+    DISCORD_EMBED_TOTAL_LIMIT,
+    DISCORD_EMBEDS_PER_MESSAGE_LIMIT,
     ERROR_MESSAGE_LIFETIME,
     HEALTHY_LATENCY_MS,
     MAX_MESSAGE_HISTORY_FOR_DEBUG,
     WARNING_LATENCY_MS,
 )
+from utils.api_clients import SmogonAPIClient, create_http_session
+from utils.helpers import truncate_text
+
+# Setup logging with configurable level. Records are only enqueued on the
+# event loop thread; a listener thread does the stdout/file writes.
+_log_formatter = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(_log_formatter)
+_file_handler = logging.FileHandler("bot.log", encoding="utf-8")
+_file_handler.setFormatter(_log_formatter)
+
+log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(
+    log_queue, _stream_handler, _file_handler, respect_handler_level=True
+)
+
+root_logger = logging.getLogger()
+root_logger.setLevel(getattr(logging, LOG_LEVEL.upper(), logging.INFO))
+root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+log_listener.start()
+# Drain queued records at interpreter exit, including ones logged after close()
+atexit.register(log_listener.stop)
+
+logger = logging.getLogger("smogon_bot")
 
 # Validate configuration before proceeding
 try:
     validate_settings()
-    logging.info("✅ Configuration validation passed")
+    logger.info("✅ Configuration validation passed")
 except ValueError as e:
-    logging.critical(f"❌ Configuration validation failed: {e}")
+    logger.critical(f"❌ Configuration validation failed: {e}")
     sys.exit(1)
 
-# Setup logging with configurable level
-logging.basicConfig(
-    level=getattr(logging, LOG_LEVEL.upper(), logging.INFO),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler("bot.log", encoding="utf-8"),
-    ],
-)
-logger = logging.getLogger("smogon_bot")
-
 # Setup intents
 intents = discord.Intents.default()
 intents.message_content = True
 intents.guilds = True
 
 # Shiny detection pattern
-SHINY_PATTERN = re.compile(
+SHINY_PATTERN: Final = re.compile(
     r"A\s+wild\s+\*\*Lv\d+\s+★",
     re.UNICODE | re.IGNORECASE,
 )
 
+# Every shiny match contains this literal - a C-level substring check rejects
+# the common non-shiny message without entering the regex engine
+SHINY_STAR = "★"
+
 # Pre-built notification message
 NOTIFICATION_CACHE = SHINY_NOTIFICATION_MESSAGE
 
+# Prefix-dependent strings - constant for the life of the process
+HELP_HINT = f"Use `{COMMAND_PREFIX}help` for command usage."
+PRESENCE_NAME = f"Pokemon Smogon | {COMMAND_PREFIX}smogon"
+
+# Error message templates shared by the prefix and slash command error handlers
+ERR_COOLDOWN = "⏱️ This command is on cooldown. Try again in **{:.1f}s**"
+ERR_MISSING_ARG = "❌ Missing required argument: `{}`\n" + HELP_HINT
+ERR_BAD_ARG = "❌ Invalid argument provided!\n" + HELP_HINT
+ERR_USER_PERMS = "❌ You don't have permission to use this command!\nRequired: `{}`"
+ERR_BOT_PERMS = "❌ I don't have the required permissions!\nMissing: `{}`"
+ERR_CHECK_FAILED = "❌ You don't have permission to use this command!"
+ERR_UNEXPECTED = "❌ An unexpected error occurred. Please try again later."
+
+# Uptime decomposition
+SECONDS_PER_MINUTE: Final = 60
+SECONDS_PER_HOUR: Final = 60 * SECONDS_PER_MINUTE
+SECONDS_PER_DAY: Final = 24 * SECONDS_PER_HOUR
+
+# Embed colors
+COLOR_GOLD: Final = 0xFFD700
+COLOR_GREEN: Final = 0x00FF00
+COLOR_NEUTRAL: Final = 0x2B2D31
+
+# Archive status marks indexed by bool(embed_channel_id)
+ARCHIVE_MARKS = ("✗", "✓")
+
+# Cache hit-rate tiers: bisect over the thresholds indexes the emoji directly
+HIT_RATE_THRESHOLDS = (40, 70)
+HIT_RATE_EMOJIS = ("🔴", "🟡", "🟢")
+
 
 class GuildShinyConfig:
     """
     Configuration for shiny monitoring in a specific guild
 
-    Uses __slots__ for memory efficiency (~30% less memory per instance)
+    Uses __slots__ for memory efficiency (~30% less memory per instance).
+    ``channels`` is an immutable snapshot replaced on every write, so its
+    readers (the save snapshot's to_dict, get_channel_list) always see one
+    consistent set, and every change is a single reassignment.
     """
 
-    __slots__ = ("guild_id", "channels", "embed_channel_id")
+    __slots__ = (
+        "guild_id",
+        "channels",
+        "embed_channel_id",
+        "_archive_channel",
+        "_channel_list",
+    )
 
     def __init__(self, guild_id: int):
         self.guild_id = guild_id
-        self.channels: Set[int] = set()
+        self.channels: FrozenSet[int] = frozenset()
         self.embed_channel_id: Optional[int] = None
+        # Resolved archive channel - runtime cache only, never serialized
+        self._archive_channel: Optional[discord.abc.Messageable] = None
+        # Rendered `/shiny-channel list` lines - runtime cache only
+        self._channel_list: Optional[str] = None
+
+    def get_archive_channel(
+        self, bot: commands.Bot
+    ) -> Optional[discord.abc.Messageable]:
+        """Resolve the archive channel, caching the object after the first lookup"""
+        if self._archive_channel is None and self.embed_channel_id:
+            self._archive_channel = bot.get_channel(self.embed_channel_id)
+        return self._archive_channel
+
+    async def fetch_archive_channel(
+        self, bot: commands.Bot
+    ) -> Optional[discord.abc.Messageable]:
+        """Resolve the archive channel from cache, falling back to the API"""
+        channel = self.get_archive_channel(bot)
+        if channel is None and self.embed_channel_id:
+            try:
+                channel = await bot.fetch_channel(self.embed_channel_id)
+            except (discord.HTTPException, discord.InvalidData) as e:
+                # Callers fall back to "Unknown Channel"; retry on the next call
+                logger.debug(
+                    "Could not fetch archive channel %s: %s", self.embed_channel_id, e
+                )
+                return None
+            self._archive_channel = channel
+        return channel
+
+    def set_archive_channel(self, channel: Optional[discord.abc.GuildChannel]):
+        """Set (or unset with None) the archive channel and its cached object"""
+        self.embed_channel_id = channel.id if channel else None
+        self._archive_channel = channel
+
+    def invalidate_archive_channel(self):
+        """Drop the cached archive channel so the next lookup re-resolves it"""
+        self._archive_channel = None
+
+    def get_channel_list(self, guild: discord.Guild) -> str:
+        """Render the monitored channels as bullet lines, cached until they change"""
+        if self._channel_list is not None:
+            return self._channel_list
+
+        channel_list = []
+        all_resolved = True
+        for channel_id in self.channels:
+            # Monitored channels can be threads (added via interaction.channel)
+            channel_obj = guild.get_channel_or_thread(channel_id)
+            if channel_obj:
+                channel_list.append(f"• {channel_obj.mention}")
+            else:
+                channel_list.append(f"• Unknown Channel (`{channel_id}`)")
+                all_resolved = False
+
+        rendered = "\n".join(channel_list) if channel_list else "None"
+        # A channel missing from the cache (e.g. an archived thread) may
+        # resolve later, so only cache a fully resolved list
+        if all_resolved:
+            self._channel_list = rendered
+        return rendered
+
+    def invalidate_channel_list(self):
+        """Drop the rendered channel list so the next lookup rebuilds it"""
+        self._channel_list = None
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON storage"""
@@ -86,7 +225,7 @@ class GuildShinyConfig:
     def from_dict(cls, guild_id: int, data: dict) -> "GuildShinyConfig":
         """Create from dictionary"""
         config = cls(guild_id)
-        config.channels = set(data.get("channels", []))
+        config.channels = frozenset(data.get("channels", []))
         config.embed_channel_id = data.get("embed_channel_id")
         return config
 
@@ -98,6 +237,29 @@ class SmogonBot(commands.Bot):
         super().__init__(*args, **kwargs)
         self.start_time: Optional[float] = None
         self.shiny_configs: Dict[int, GuildShinyConfig] = {}
+        # Flat union of every guild's channels for the on_message gate.
+        # Only mutate through add/remove/clear_shiny_channel(s) below.
+        self.monitored_channel_ids: Set[int] = set()
+        # Pooled HTTP session shared by every cog's API client (set in main)
+        self.http_session: Optional[aiohttp.ClientSession] = None
+        # API clients owned by loaded cogs, keyed by cog name (see add_cog)
+        self.api_clients: Dict[str, SmogonAPIClient] = {}
+        # Sum of member counts across guilds, recomputed lazily after guild events
+        self._user_count: Optional[int] = None
+        self._user_count_str: Optional[str] = None
+        # Rounded latency only changes when a heartbeat ACK updates bot.latency
+        self._latency_raw: Optional[float] = None
+        self._latency_ms = 0.0
+        # Slash commands only need syncing once per process, not per on_ready
+        self._commands_synced = False
+
+        # Debounced config persistence - commands mark dirty, one task writes
+        self._configs_dirty = asyncio.Event()
+        self._save_lock = asyncio.Lock()
+        self._save_task: Optional[asyncio.Task] = None
+        # Set once setup_hook has loaded the configs; a failed login never
+        # gets there, and close() must not write empty configs over the file
+        self._configs_loaded = False
 
     async def setup_hook(self):
         """Called when bot is starting up - for async initialization"""
@@ -105,57 +267,168 @@ class SmogonBot(commands.Bot):
         self.start_time = time.time()
 
         # Load per-guild shiny configurations
-        self.shiny_configs = load_shiny_configs()
+        self.shiny_configs = await load_shiny_configs()
+        self._configs_loaded = True
 
-        total_channels = sum(
-            len(config.channels) for config in self.shiny_configs.values()
-        )
-        total_archives = sum(
-            1 for config in self.shiny_configs.values() if config.embed_channel_id
-        )
+        # Single pass over the configs for both totals
+        total_channels = 0
+        total_archives = 0
+        for config in self.shiny_configs.values():
+            self.monitored_channel_ids |= config.channels
+            total_channels += len(config.channels)
+            if config.embed_channel_id:
+                total_archives += 1
+
+        logger.info("Loaded configurations for %d guild(s)", len(self.shiny_configs))
+        logger.info("Total monitored channels: %d", total_channels)
+        logger.info("Guilds with archive channels: %d", total_archives)
 
-        logger.info(f"Loaded configurations for {len(self.shiny_configs)} guild(s)")
-        logger.info(f"Total monitored channels: {total_channels}")
-        logger.info(f"Guilds with archive channels: {total_archives}")
+        self._save_task = asyncio.create_task(self._config_flush_loop())
 
     async def close(self):
         """Override close to ensure proper cleanup of resources"""
         logger.info("Bot shutdown initiated - cleaning up resources")
 
-        # Save shiny configurations before shutdown
-        await save_shiny_configs(self.shiny_configs)
-        logger.info("Saved shiny configurations")
-
-        # Close API client sessions from all loaded cogs
-        for cog_name, cog in self.cogs.items():
-            if hasattr(cog, "api_client"):
-                try:
-                    await cog.api_client.close()
-                    logger.info(f"Closed API client for cog: {cog_name}")
-                except Exception as e:
-                    logger.error(f"Error closing API client for {cog_name}: {e}")
+        # Stop the debounced writer, then flush whatever is still pending
+        if self._save_task and not self._save_task.done():
+            self._save_task.cancel()
+            try:
+                await self._save_task
+            except asyncio.CancelledError:
+                pass
+
+        # The shielded flush outlives the cancelled loop - wait for it to
+        # release the lock before checking whether anything is still dirty
+        async with self._save_lock:
+            pass
+
+        if self._configs_loaded and self._configs_dirty.is_set():
+            await self.flush_shiny_configs()
+            logger.info("Saved shiny configurations")
+
+        # Close API client sessions from all loaded cogs concurrently
+        results = await asyncio.gather(
+            *(api_client.close() for api_client in self.api_clients.values()),
+            return_exceptions=True,
+        )
+        for cog_name, result in zip(self.api_clients, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error closing API client for {cog_name}: {result}")
+            else:
+                logger.info("Closed API client for cog: %s", cog_name)
 
         logger.info("Cleanup complete - shutting down bot")
         await super().close()
 
+    async def add_cog(self, cog: commands.Cog, /, **kwargs):
+        """Register a cog, recording its API client if it owns one"""
+        await super().add_cog(cog, **kwargs)
+        api_client = getattr(cog, "api_client", None)
+        if api_client is not None:
+            self.api_clients[cog.qualified_name] = api_client
+
+    async def remove_cog(self, name: str, /, **kwargs) -> Optional[commands.Cog]:
+        """Unregister a cog and forget its API client"""
+        cog = await super().remove_cog(name, **kwargs)
+        self.api_clients.pop(name, None)
+        return cog
+
     def get_guild_config(self, guild_id: int) -> GuildShinyConfig:
         """Get or create guild configuration"""
         if guild_id not in self.shiny_configs:
             self.shiny_configs[guild_id] = GuildShinyConfig(guild_id)
-            logger.info(f"Created new configuration for guild {guild_id}")
+            logger.info("Created new configuration for guild %s", guild_id)
         return self.shiny_configs[guild_id]
 
+    def add_shiny_channel(self, guild_config: GuildShinyConfig, channel_id: int):
+        """Start monitoring a channel"""
+        guild_config.channels = guild_config.channels | {channel_id}
+        guild_config.invalidate_channel_list()
+        self.monitored_channel_ids.add(channel_id)
+
+    def remove_shiny_channel(self, guild_config: GuildShinyConfig, channel_id: int):
+        """Stop monitoring a channel"""
+        guild_config.channels = guild_config.channels - {channel_id}
+        guild_config.invalidate_channel_list()
+        self.monitored_channel_ids.discard(channel_id)
+
+    def clear_shiny_channels(self, guild_config: GuildShinyConfig) -> int:
+        """Stop monitoring all of a guild's channels, returning how many there were"""
+        count = len(guild_config.channels)
+        self.monitored_channel_ids -= guild_config.channels
+        guild_config.channels = frozenset()
+        guild_config.invalidate_channel_list()
+        return count
+
+    def get_latency_ms(self) -> float:
+        """WebSocket latency in ms (2 dp), re-rounded only when it changes"""
+        latency = self.latency
+        if latency != self._latency_raw:
+            self._latency_raw = latency
+            self._latency_ms = round(latency * 1000, 2)
+        return self._latency_ms
+
+    def get_user_count(self) -> int:
+        """Total members across all guilds (cached until a guild event)"""
+        if self._user_count is None:
+            self._user_count = sum(
+                g.member_count for g in self.guilds if g.member_count
+            )
+        return self._user_count
+
+    def get_user_count_str(self) -> str:
+        """get_user_count() with thousands separators, cached alongside it"""
+        if self._user_count_str is None:
+            self._user_count_str = f"{self.get_user_count():,}"
+        return self._user_count_str
+
+    def invalidate_user_count(self):
+        """Force the next get_user_count() to re-sum the guild member counts"""
+        self._user_count = None
+        self._user_count_str = None
+
+    def mark_configs_dirty(self):
+        """Schedule a debounced save of the shiny configurations"""
+        self._configs_dirty.set()
+
+    async def flush_shiny_configs(self) -> bool:
+        """Save shiny configurations now (serialized against in-flight saves)"""
+        self._configs_dirty.clear()
+        async with self._save_lock:
+            saved = await save_shiny_configs(self.shiny_configs)
+        if not saved:
+            # Keep the edits pending so the flush loop retries the write
+            self._configs_dirty.set()
+        return saved
+
+    async def _config_flush_loop(self):
+        """Background task coalescing bursts of config edits into one write"""
+        while True:
+            await self._configs_dirty.wait()
+            await asyncio.sleep(CACHE_SAVE_DEBOUNCE_SECONDS)
+            # Shielded so cancelling the loop can't interrupt a write;
+            # close() waits on _save_lock for it to finish
+            await asyncio.shield(self.flush_shiny_configs())
+
 
 # Create bot instance
-bot = SmogonBot(command_prefix=COMMAND_PREFIX, intents=intents, help_command=None)
+# The activity is sent in every IDENTIFY, so reconnects keep the presence
+# without an extra change_presence call from on_ready
+bot = SmogonBot(
+    command_prefix=COMMAND_PREFIX,
+    intents=intents,
+    help_command=None,
+    activity=discord.Game(name=PRESENCE_NAME),
+)
 
 
-def load_shiny_configs() -> Dict[int, GuildShinyConfig]:
+async def load_shiny_configs() -> Dict[int, GuildShinyConfig]:
     """Load per-guild shiny configurations from JSON file"""
-    try:
-        if SHINY_CONFIG_FILE.exists():
-            with open(SHINY_CONFIG_FILE, "r") as f:
-                data = json.load(f)
+
+    def _sync_load() -> Dict[int, GuildShinyConfig]:
+        try:
+            if SHINY_CONFIG_FILE.exists():
+                data = orjson.loads(SHINY_CONFIG_FILE.read_bytes())
 
                 if "channels" in data and "guilds" not in data:
                     logger.warning(
@@ -172,20 +445,28 @@ def load_shiny_configs() -> Dict[int, GuildShinyConfig]:
 
                 return configs
 
-        return {}
-    except json.JSONDecodeError as e:
-        logger.error(f"❌ Corrupted JSON in shiny config file: {e}")
-        logger.warning(
-            "Starting with empty config - previous config may be in .bak file"
-        )
-        return {}
-    except Exception as e:
-        logger.error(f"Error loading shiny configurations: {e}")
-        return {}
+            return {}
+        except orjson.JSONDecodeError as e:
+            logger.error(f"❌ Corrupted JSON in shiny config file: {e}")
+            logger.warning(
+                "Starting with empty config - previous config may be in .bak file"
+            )
+            return {}
+        except Exception as e:
+            logger.error(f"Error loading shiny configurations: {e}")
+            return {}
+
+    return await asyncio.to_thread(_sync_load)
 
 
 async def save_shiny_configs(configs: Dict[int, GuildShinyConfig]) -> bool:
     """Save per-guild shiny configurations to JSON file with atomic writes"""
+    # Snapshot on the event loop - commands and guild events add and remove
+    # configs while the write runs in a worker thread.
+    # OPT_NON_STR_KEYS below serializes the int guild IDs as strings
+    data = {
+        "guilds": {guild_id: config.to_dict() for guild_id, config in configs.items()}
+    }
 
     def _sync_save() -> bool:
         # PERFORMANCE: Lazy import - only load when actually saving
@@ -203,39 +484,36 @@ async def save_shiny_configs(configs: Dict[int, GuildShinyConfig]) -> bool:
                 logger.error(f"❌ OS error creating directory: {e}")
                 return False
 
-            guilds_data = {}
-            for guild_id, config in configs.items():
-                guilds_data[str(guild_id)] = config.to_dict()
-
-            data = {"guilds": guilds_data}
-
             if SHINY_CONFIG_FILE.exists():
                 backup_file = SHINY_CONFIG_FILE.with_suffix(".json.bak")
                 try:
-                    shutil.copy2(SHINY_CONFIG_FILE, backup_file)
-                    logger.debug(f"Created backup: {backup_file}")
+                    # Hard link keeps the current inode as the backup once the
+                    # replace below swaps in the new file - no data is copied
+                    backup_file.unlink(missing_ok=True)
+                    try:
+                        os.link(SHINY_CONFIG_FILE, backup_file)
+                    except OSError:
+                        # Filesystem without hard link support
+                        shutil.copy2(SHINY_CONFIG_FILE, backup_file)
+                    logger.debug("Created backup: %s", backup_file)
                 except Exception as e:
-                    logger.warning(f"Could not create backup: {e}")
+                    logger.warning("Could not create backup: %s", e)
 
             temp_file = SHINY_CONFIG_FILE.with_suffix(".json.tmp")
 
             try:
-                with open(temp_file, "w") as f:
-                    json.dump(data, f, indent=2)
-
-                with open(temp_file, "r") as f:
-                    json.load(f)
-
-                temp_file.replace(SHINY_CONFIG_FILE)
+                # orjson output is always valid JSON, so no read-back check;
+                # os.replace is a single atomic rename over the old file
+                temp_file.write_bytes(
+                    orjson.dumps(
+                        data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    )
+                )
+                os.replace(temp_file, SHINY_CONFIG_FILE)
 
                 logger.debug("Saved shiny configs atomically")
                 return True
 
-            except json.JSONDecodeError as e:
-                logger.error(f"❌ Generated invalid JSON: {e}")
-                if temp_file.exists():
-                    temp_file.unlink()
-                return False
             except Exception as e:
                 logger.error(f"❌ Error during atomic write: {e}")
                 if temp_file.exists():
@@ -249,15 +527,20 @@ async def save_shiny_configs(configs: Dict[int, GuildShinyConfig]) -> bool:
     return await asyncio.to_thread(_sync_save)
 
 
+def is_shiny(text: str) -> bool:
+    """Check text for a shiny spawn, skipping the regex when the star is absent"""
+    return SHINY_STAR in text and SHINY_PATTERN.search(text) is not None
+
+
 async def forward_shiny_to_archive(
     bot: SmogonBot,
     guild_config: GuildShinyConfig,
     first_embed: discord.Embed,
     message: discord.Message,
 ):
-    """Forward shiny embed to archive channel (background task)"""
+    """Forward shiny embed to archive channel (handles its own errors)"""
     try:
-        archive_channel = bot.get_channel(guild_config.embed_channel_id)
+        archive_channel = guild_config.get_archive_channel(bot)
 
         if not archive_channel:
             logger.warning(
@@ -279,16 +562,28 @@ async def forward_shiny_to_archive(
             content=f"Jump to message: {jump_link}", embed=first_embed
         )
 
-        logger.info(
-            f"Forwarded shiny embed to archive channel {archive_channel.name} "
-            f"in {message.guild.name}",
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Forwarded shiny embed to archive channel %s in %s",
+                archive_channel.name,
+                message.guild.name,
+                extra={
+                    "guild_id": message.guild.id,
+                    "channel_id": archive_channel.id,
+                    "message_id": message.id,
+                },
+            )
+
+    except discord.NotFound:
+        guild_config.invalidate_archive_channel()
+        logger.warning(
+            f"Archive channel {guild_config.embed_channel_id} "
+            f"in {message.guild.name} no longer exists",
             extra={
                 "guild_id": message.guild.id,
-                "channel_id": archive_channel.id,
-                "message_id": message.id,
+                "channel_id": guild_config.embed_channel_id,
             },
         )
-
     except discord.Forbidden:
         logger.error(
             f"No permission to send in archive channel "
@@ -314,34 +609,43 @@ async def forward_shiny_to_archive(
 @bot.event
 async def on_ready():
     """Called when bot successfully connects to Discord"""
-    logger.info(f"{'=' * 50}")
-    logger.info(f"{bot.user.name} has connected to Discord!")
-    logger.info(f"Bot ID: {bot.user.id}")
-    logger.info(f"Connected to {len(bot.guilds)} guild(s)")
-    logger.info(f"Discord.py version: {discord.__version__}")
+    bot.invalidate_user_count()
+    logger.info("=" * 50)
+    logger.info("%s has connected to Discord!", bot.user.name)
+    logger.info("Bot ID: %s", bot.user.id)
+    logger.info("Connected to %d guild(s)", len(bot.guilds))
+    logger.info("Discord.py version: %s", discord.__version__)
 
     if TARGET_USER_ID:
-        logger.info(f"Monitoring user ID: {TARGET_USER_ID} for shiny Pokemon")
+        logger.info("Monitoring user ID: %s for shiny Pokemon", TARGET_USER_ID)
 
-    for guild in bot.guilds:
-        if guild.id in bot.shiny_configs:
-            config = bot.shiny_configs[guild.id]
-            logger.info(
-                f"  └─ {guild.name}: {len(config.channels)} monitored channel(s), "
-                f"archive: {'✓' if config.embed_channel_id else '✗'}"
-            )
+    # Only visit guilds that are both connected and configured
+    guild_by_id = {guild.id: guild for guild in bot.guilds}
+    for guild_id in bot.shiny_configs.keys() & guild_by_id.keys():
+        config = bot.shiny_configs[guild_id]
+        logger.info(
+            "  └─ %s: %d monitored channel(s), archive: %s",
+            guild_by_id[guild_id].name,
+            len(config.channels),
+            ARCHIVE_MARKS[bool(config.embed_channel_id)],
+        )
 
-    logger.info(f"{'=' * 50}")
+    logger.info("=" * 50)
 
-    try:
-        synced = await bot.tree.sync()
-        logger.info(f"✅ Synced {len(synced)} slash command(s)")
-    except Exception as e:
-        logger.error(f"❌ Failed to sync commands: {e}")
+    if not bot._commands_synced:
+        try:
+            synced = await bot.tree.sync()
+            bot._commands_synced = True
+            logger.info("✅ Synced %d slash command(s)", len(synced))
+        except Exception as e:
+            logger.error(f"❌ Failed to sync commands: {e}")
 
-    await bot.change_presence(
-        activity=discord.Game(name=f"Pokemon Smogon | {COMMAND_PREFIX}smogon")
-    )
+
+async def process_prefixed_commands(message: discord.Message):
+    """Run command resolution only for messages that start with the prefix"""
+    # The bot has no mention prefix, so anything else can never be a command
+    if message.content.startswith(COMMAND_PREFIX):
+        await bot.process_commands(message)
 
 
 @bot.event
@@ -351,78 +655,99 @@ async def on_message(message: discord.Message):
     if message.author.id == bot.user.id:
         return
 
+    # Everyone but the target user only matters when invoking a prefix command
+    if not (TARGET_USER_ID and message.author.id == TARGET_USER_ID):
+        await process_prefixed_commands(message)
+        return
+
     if not message.guild:
-        await bot.process_commands(message)
+        await process_prefixed_commands(message)
         return
 
     try:
-        if TARGET_USER_ID and message.author.id == TARGET_USER_ID:
-            if LOG_LEVEL.upper() == "DEBUG":
-                logger.debug("=" * 60)
-                logger.debug("🎯 MESSAGE FROM TARGET USER DETECTED!")
-                logger.debug(
-                    f"   Author ID: {message.author.id} (Name: {message.author.name})"
-                )
-                logger.debug(f"   Guild: {message.guild.name} (ID: {message.guild.id})")
-                logger.debug(
-                    f"   Channel: #{message.channel.name} (ID: {message.channel.id})"
-                )
-                logger.debug(f"   Message ID: {message.id}")
-                logger.debug(f"   Number of embeds: {len(message.embeds)}")
-
-                if message.embeds:
-                    for idx, embed in enumerate(message.embeds):
-                        logger.debug(f"   --- Embed {idx + 1} ---")
-
-                        if embed.description:
-                            pattern_match = SHINY_PATTERN.search(embed.description)
-                            logger.debug(
-                                f"   Description (first 150 chars): '{embed.description[:150]}'"
-                            )
-                            logger.debug(
-                                f"   Pattern match in description: {pattern_match is not None}"
-                            )
-                            if pattern_match:
-                                logger.debug(
-                                    f"   ✅ MATCHED! '{pattern_match.group()}'"
-                                )
-
-                logger.debug("=" * 60)
-
-            if not message.embeds:
-                await bot.process_commands(message)
-                return
-
-            first_embed = message.embeds[0]
-
-            if not (
-                first_embed.description
-                and SHINY_PATTERN.search(first_embed.description)
-            ):
-                await bot.process_commands(message)
-                return
-
-            guild_config = bot.shiny_configs.get(message.guild.id)
-
-            if guild_config and message.channel.id in guild_config.channels:
-                await message.channel.send(NOTIFICATION_CACHE)
-
-                logger.info(
-                    f"✨ Shiny detected in {message.guild.name}#{message.channel.name}! "
-                    f"Notification sent",
-                    extra={
-                        "guild_id": message.guild.id,
-                        "channel_id": message.channel.id,
-                        "message_id": message.id,
-                    },
-                )
+        # Unmonitored channels are the common case - skip embed work entirely
+        if message.channel.id not in bot.monitored_channel_ids:
+            await process_prefixed_commands(message)
+            return
+
+        guild_config = bot.shiny_configs[message.guild.id]
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("=" * 60)
+            logger.debug("🎯 MESSAGE FROM TARGET USER DETECTED!")
+            logger.debug(
+                "   Author ID: %s (Name: %s)",
+                message.author.id,
+                message.author.name,
+            )
+            logger.debug("   Guild: %s (ID: %s)", message.guild.name, message.guild.id)
+            logger.debug(
+                "   Channel: #%s (ID: %s)", message.channel.name, message.channel.id
+            )
+            logger.debug("   Message ID: %s", message.id)
+            logger.debug("   Number of embeds: %d", len(message.embeds))
 
-                if guild_config.embed_channel_id:
-                    asyncio.create_task(
-                        forward_shiny_to_archive(
-                            bot, guild_config, first_embed, message
-                        )
+            for idx, embed in enumerate(message.embeds, 1):
+                logger.debug("   --- Embed %d ---", idx)
+
+                if embed.description:
+                    pattern_match = SHINY_PATTERN.search(embed.description)
+                    logger.debug(
+                        "   Description (first 150 chars): '%s'",
+                        embed.description[:150],
+                    )
+                    logger.debug(
+                        "   Pattern match in description: %s",
+                        pattern_match is not None,
                     )
+                    if pattern_match:
+                        logger.debug("   ✅ MATCHED! '%s'", pattern_match.group())
+
+            logger.debug("=" * 60)
+
+        if not message.embeds:
+            await process_prefixed_commands(message)
+            return
+
+        first_embed = message.embeds[0]
+
+        if not (first_embed.description and is_shiny(first_embed.description)):
+            await process_prefixed_commands(message)
+            return
+
+        # Notification and archive target different channels - send together
+        sends = [message.channel.send(NOTIFICATION_CACHE)]
+        if guild_config.embed_channel_id:
+            sends.append(
+                forward_shiny_to_archive(bot, guild_config, first_embed, message)
+            )
+
+        notify_result, *_ = await asyncio.gather(*sends, return_exceptions=True)
+
+        if isinstance(notify_result, Exception):
+            logger.error(
+                "Failed to send shiny notification in %s#%s: %s",
+                message.guild.name,
+                message.channel.name,
+                notify_result,
+                extra={
+                    "guild_id": message.guild.id,
+                    "channel_id": message.channel.id,
+                    "message_id": message.id,
+                },
+            )
+        elif logger.isEnabledFor(logging.INFO):
+            # Guarded: the name lookups and extra dict are skipped when muted
+            logger.info(
+                "✨ Shiny detected in %s#%s! Notification sent",
+                message.guild.name,
+                message.channel.name,
+                extra={
+                    "guild_id": message.guild.id,
+                    "channel_id": message.channel.id,
+                    "message_id": message.id,
+                },
+            )
 
     except Exception as e:
         logger.error(
@@ -435,26 +760,106 @@ async def on_message(message: discord.Message):
             exc_info=True,
         )
 
-    await bot.process_commands(message)
+    await process_prefixed_commands(message)
+
+
+# Without a target user no message can be a shiny for the life of the
+# process - dispatch straight to the prefix check instead
+if not TARGET_USER_ID:
+    bot.on_message = process_prefixed_commands
 
 
 @bot.event
 async def on_guild_join(guild: discord.Guild):
     """Called when bot joins a new guild"""
     logger.info(
-        f"✅ Joined guild: {guild.name} (ID: {guild.id}, Members: {guild.member_count})"
+        "✅ Joined guild: %s (ID: %s, Members: %s)",
+        guild.name,
+        guild.id,
+        guild.member_count,
     )
     bot.get_guild_config(guild.id)
+    bot.invalidate_user_count()
+
+
+@bot.event
+async def on_guild_available(guild: discord.Guild):
+    """Guild came back online - its member count may have changed"""
+    bot.invalidate_user_count()
+
+
+@bot.event
+async def on_guild_unavailable(guild: discord.Guild):
+    """Guild went offline (outage)"""
+    bot.invalidate_user_count()
 
 
 @bot.event
 async def on_guild_remove(guild: discord.Guild):
     """Called when bot is removed from a guild"""
-    logger.info(f"❌ Removed from guild: {guild.name} (ID: {guild.id})")
+    logger.info("❌ Removed from guild: %s (ID: %s)", guild.name, guild.id)
+    bot.invalidate_user_count()
     if guild.id in bot.shiny_configs:
-        del bot.shiny_configs[guild.id]
-        await save_shiny_configs(bot.shiny_configs)
-        logger.info(f"Removed configuration for guild {guild.id}")
+        bot.clear_shiny_channels(bot.shiny_configs.pop(guild.id))
+        bot.mark_configs_dirty()
+        logger.info("Removed configuration for guild %s", guild.id)
+
+
+@bot.event
+async def on_guild_channel_delete(channel: discord.abc.GuildChannel):
+    """Drop cached channel lookups that referenced the deleted channel"""
+    guild_config = bot.shiny_configs.get(channel.guild.id)
+    if not guild_config:
+        return
+    if guild_config.embed_channel_id == channel.id:
+        guild_config.invalidate_archive_channel()
+    if channel.id in guild_config.channels:
+        guild_config.invalidate_channel_list()
+
+
+@bot.event
+async def on_thread_delete(thread: discord.Thread):
+    """on_guild_channel_delete never fires for threads, so drop their lookups here"""
+    guild_config = bot.shiny_configs.get(thread.guild.id)
+    if guild_config and thread.id in guild_config.channels:
+        guild_config.invalidate_channel_list()
+
+
+# Error type -> user-facing message. Looked up along the error's MRO so
+# subclasses (e.g. NoPrivateMessage -> CheckFailure) resolve like isinstance.
+PREFIX_ERROR_MESSAGES = {
+    commands.CommandOnCooldown: lambda e: ERR_COOLDOWN.format(e.retry_after),
+    commands.MissingRequiredArgument: lambda e: ERR_MISSING_ARG.format(e.param.name),
+    commands.BadArgument: lambda e: ERR_BAD_ARG,
+    commands.MissingPermissions: lambda e: ERR_USER_PERMS.format(
+        ", ".join(e.missing_permissions)
+    ),
+    commands.BotMissingPermissions: lambda e: ERR_BOT_PERMS.format(
+        ", ".join(e.missing_permissions)
+    ),
+    commands.CheckFailure: lambda e: ERR_CHECK_FAILED,
+}
+
+APP_ERROR_MESSAGES = {
+    discord.app_commands.CommandOnCooldown: lambda e: ERR_COOLDOWN.format(
+        e.retry_after
+    ),
+    discord.app_commands.MissingPermissions: lambda e: ERR_USER_PERMS.format(
+        ", ".join(e.missing_permissions)
+    ),
+    discord.app_commands.BotMissingPermissions: lambda e: ERR_BOT_PERMS.format(
+        ", ".join(e.missing_permissions)
+    ),
+}
+
+
+def resolve_error_message(error: Exception, messages: dict) -> Optional[str]:
+    """Return the user-facing message for a known error type, else None"""
+    for error_type in type(error).__mro__:
+        build_message = messages.get(error_type)
+        if build_message is not None:
+            return build_message(error)
+    return None
 
 
 @bot.event
@@ -464,43 +869,13 @@ async def on_command_error(ctx: commands.Context, error: commands.CommandError):
     if isinstance(error, commands.CommandNotFound):
         return
 
-    if isinstance(error, commands.CommandOnCooldown):
-        await ctx.send(
-            f"⏱️ This command is on cooldown. Try again in **{error.retry_after:.1f}s**",
-            delete_after=ERROR_MESSAGE_LIFETIME,
-        )
-    elif isinstance(error, commands.MissingRequiredArgument):
-        await ctx.send(
-            f"❌ Missing required argument: `{error.param.name}`\n"
-            f"Use `{COMMAND_PREFIX}help` for command usage.",
-            delete_after=ERROR_MESSAGE_LIFETIME,
-        )
-    elif isinstance(error, commands.BadArgument):
-        await ctx.send(
-            f"❌ Invalid argument provided!\n"
-            f"Use `{COMMAND_PREFIX}help` for command usage.",
-            delete_after=ERROR_MESSAGE_LIFETIME,
-        )
-    elif isinstance(error, commands.MissingPermissions):
-        perms = ", ".join(error.missing_permissions)
-        await ctx.send(
-            f"❌ You don't have permission to use this command!\nRequired: `{perms}`",
-            delete_after=ERROR_MESSAGE_LIFETIME,
-        )
-    elif isinstance(error, commands.BotMissingPermissions):
-        perms = ", ".join(error.missing_permissions)
-        await ctx.send(
-            f"❌ I don't have the required permissions!\nMissing: `{perms}`",
-            delete_after=ERROR_MESSAGE_LIFETIME,
-        )
-    elif isinstance(error, commands.CheckFailure):
-        await ctx.send(
-            "❌ You don't have permission to use this command!",
-            delete_after=ERROR_MESSAGE_LIFETIME,
-        )
-    else:
+    error_message = resolve_error_message(error, PREFIX_ERROR_MESSAGES)
+
+    if error_message is None:
         logger.error(
-            f"Unexpected error in command '{ctx.command}': {error}",
+            "Unexpected error in command '%s': %s",
+            ctx.command,
+            error,
             extra={
                 "command": ctx.command.name if ctx.command else "unknown",
                 "user_id": ctx.author.id,
@@ -508,10 +883,9 @@ async def on_command_error(ctx: commands.Context, error: commands.CommandError):
             },
             exc_info=error,
         )
-        await ctx.send(
-            "❌ An unexpected error occurred. Please try again later.",
-            delete_after=ERROR_MESSAGE_LIFETIME,
-        )
+        error_message = ERR_UNEXPECTED
+
+    await ctx.send(error_message, delete_after=ERROR_MESSAGE_LIFETIME)
 
 
 @bot.tree.error
@@ -525,21 +899,12 @@ async def on_app_command_error(
     else:
         send_method = interaction.response.send_message
 
-    if isinstance(error, discord.app_commands.CommandOnCooldown):
-        error_message = (
-            f"⏱️ This command is on cooldown. Try again in **{error.retry_after:.1f}s**"
-        )
-    elif isinstance(error, discord.app_commands.MissingPermissions):
-        perms = ", ".join(error.missing_permissions)
-        error_message = (
-            f"❌ You don't have permission to use this command!\nRequired: `{perms}`"
-        )
-    elif isinstance(error, discord.app_commands.BotMissingPermissions):
-        perms = ", ".join(error.missing_permissions)
-        error_message = f"❌ I don't have the required permissions!\nMissing: `{perms}`"
-    else:
+    error_message = resolve_error_message(error, APP_ERROR_MESSAGES)
+
+    if error_message is None:
         logger.error(
-            f"Unexpected slash command error: {error}",
+            "Unexpected slash command error: %s",
+            error,
             extra={
                 "command": interaction.command.name
                 if interaction.command
@@ -549,12 +914,12 @@ async def on_app_command_error(
             },
             exc_info=error,
         )
-        error_message = "❌ An unexpected error occurred. Please try again later."
+        error_message = ERR_UNEXPECTED
 
     try:
         await send_method(error_message, ephemeral=True)
-    except Exception as e:
-        logger.error(f"Failed to send error message: {e}", exc_info=e)
+    except (discord.HTTPException, discord.InteractionResponded) as e:
+        logger.error("Failed to send error message: %s", e, exc_info=e)
 
 
 # ========================================
@@ -574,14 +939,13 @@ async def cache_stats(interaction: discord.Interaction):
         )
         return
 
-    smogon_cog = bot.get_cog("Smogon")
-    if not smogon_cog or not hasattr(smogon_cog, "api_client"):
+    api_client = bot.api_clients.get("Smogon")
+    if api_client is None:
         await interaction.response.send_message(
             "❌ API client not available.", ephemeral=True
         )
         return
 
-    api_client = smogon_cog.api_client
     stats = api_client.get_cache_stats()
 
     embed = discord.Embed(
@@ -598,9 +962,9 @@ async def cache_stats(interaction: discord.Interaction):
     )
 
     hit_rate_value = float(stats["hit_rate"].rstrip("%"))
-    hit_rate_emoji = (
-        "🟢" if hit_rate_value >= 70 else "🟡" if hit_rate_value >= 40 else "🔴"
-    )
+    hit_rate_emoji = HIT_RATE_EMOJIS[
+        bisect.bisect_right(HIT_RATE_THRESHOLDS, hit_rate_value)
+    ]
 
     embed.add_field(
         name=f"{hit_rate_emoji} Hit Rate",
@@ -633,14 +997,13 @@ async def cache_clear(interaction: discord.Interaction):
         )
         return
 
-    smogon_cog = bot.get_cog("Smogon")
-    if not smogon_cog or not hasattr(smogon_cog, "api_client"):
+    api_client = bot.api_clients.get("Smogon")
+    if api_client is None:
         await interaction.response.send_message(
             "❌ API client not available.", ephemeral=True
         )
         return
 
-    api_client = smogon_cog.api_client
     old_stats = api_client.get_cache_stats()
 
     await api_client.clear_cache()
@@ -648,7 +1011,7 @@ async def cache_clear(interaction: discord.Interaction):
     embed = discord.Embed(
         title="✅ Cache Cleared",
         description="API cache has been manually cleared",
-        color=0x00FF00,
+        color=COLOR_GREEN,
         timestamp=interaction.created_at,
     )
 
@@ -716,8 +1079,8 @@ async def shiny_channel(
                 ephemeral=True,
             )
         else:
-            guild_config.channels.add(target_channel.id)
-            await save_shiny_configs(bot.shiny_configs)
+            bot.add_shiny_channel(guild_config, target_channel.id)
+            bot.mark_configs_dirty()
             await interaction.response.send_message(
                 f"✅ Added {target_channel.mention} to shiny monitoring.\n"
                 f"Total channels: {len(guild_config.channels)}",
@@ -731,8 +1094,8 @@ async def shiny_channel(
                 ephemeral=True,
             )
         else:
-            guild_config.channels.remove(target_channel.id)
-            await save_shiny_configs(bot.shiny_configs)
+            bot.remove_shiny_channel(guild_config, target_channel.id)
+            bot.mark_configs_dirty()
             await interaction.response.send_message(
                 f"✅ Removed {target_channel.mention} from monitoring.\n"
                 f"Total channels: {len(guild_config.channels)}",
@@ -750,29 +1113,20 @@ async def shiny_channel(
             embed = discord.Embed(
                 title=f"🔍 Shiny Monitoring - {interaction.guild.name}",
                 description=f"Total: {len(guild_config.channels)} channel(s)",
-                color=0xFFD700,
+                color=COLOR_GOLD,
             )
 
-            channel_list = []
-            for channel_id in guild_config.channels:
-                channel_obj = bot.get_channel(channel_id)
-                if channel_obj:
-                    channel_list.append(f"• {channel_obj.mention}")
-                else:
-                    channel_list.append(f"• Unknown Channel (`{channel_id}`)")
-
             embed.add_field(
                 name="Monitored Channels",
-                value="\n".join(channel_list) if channel_list else "None",
+                value=guild_config.get_channel_list(interaction.guild),
                 inline=False,
             )
 
             await interaction.response.send_message(embed=embed, ephemeral=True)
 
     elif action_value == "clear":
-        count = len(guild_config.channels)
-        guild_config.channels.clear()
-        await save_shiny_configs(bot.shiny_configs)
+        count = bot.clear_shiny_channels(guild_config)
+        bot.mark_configs_dirty()
         await interaction.response.send_message(
             f"✅ Cleared all shiny monitoring channels ({count} removed).",
             ephemeral=True,
@@ -818,8 +1172,8 @@ async def shiny_archive(
 
     if action_value == "set":
         target_channel = channel or interaction.channel
-        guild_config.embed_channel_id = target_channel.id
-        await save_shiny_configs(bot.shiny_configs)
+        guild_config.set_archive_channel(target_channel)
+        bot.mark_configs_dirty()
 
         await interaction.response.send_message(
             f"✅ Set {target_channel.mention} as the shiny archive channel for **{interaction.guild.name}**.\n"
@@ -827,8 +1181,11 @@ async def shiny_archive(
             ephemeral=True,
         )
         logger.info(
-            f"Set shiny archive channel to {target_channel.name} ({target_channel.id}) "
-            f"in guild {interaction.guild.name} ({interaction.guild.id})"
+            "Set shiny archive channel to %s (%s) in guild %s (%s)",
+            target_channel.name,
+            target_channel.id,
+            interaction.guild.name,
+            interaction.guild.id,
         )
 
     elif action_value == "unset":
@@ -839,8 +1196,8 @@ async def shiny_archive(
             )
         else:
             old_channel_id = guild_config.embed_channel_id
-            guild_config.embed_channel_id = None
-            await save_shiny_configs(bot.shiny_configs)
+            guild_config.set_archive_channel(None)
+            bot.mark_configs_dirty()
 
             await interaction.response.send_message(
                 f"✅ Removed archive channel from **{interaction.guild.name}** (was: `{old_channel_id}`).\n"
@@ -848,8 +1205,10 @@ async def shiny_archive(
                 ephemeral=True,
             )
             logger.info(
-                f"Unset shiny archive channel (was: {old_channel_id}) "
-                f"in guild {interaction.guild.name} ({interaction.guild.id})"
+                "Unset shiny archive channel (was: %s) in guild %s (%s)",
+                old_channel_id,
+                interaction.guild.name,
+                interaction.guild.id,
             )
 
     elif action_value == "show":
@@ -860,12 +1219,12 @@ async def shiny_archive(
                 ephemeral=True,
             )
         else:
-            archive_channel = bot.get_channel(guild_config.embed_channel_id)
+            archive_channel = await guild_config.fetch_archive_channel(bot)
 
             embed = discord.Embed(
                 title=f"📦 Shiny Archive - {interaction.guild.name}",
                 description="Shiny embeds are forwarded to this channel",
-                color=0xFFD700,
+                color=COLOR_GOLD,
             )
 
             if archive_channel:
@@ -893,13 +1252,12 @@ async def shiny_archive(
 # ========================================
 
 
-@bot.hybrid_command(name="help", description="Show bot commands and usage")
-async def help_command(ctx: commands.Context):
-    """Display help information"""
+def build_help_embed() -> discord.Embed:
+    """Build the static help embed (nothing in it depends on the invocation)"""
     embed = discord.Embed(
         title="🎮 Pokemon Smogon Bot - Help",
         description="Get competitive Pokemon movesets from Smogon University",
-        color=0xFF7BA9,
+        color=BOT_COLOR,
     )
 
     embed.add_field(
@@ -917,24 +1275,32 @@ async def help_command(ctx: commands.Context):
 
     embed.set_footer(text="Data from Smogon University • Powered by pkmn.cc")
 
-    await ctx.send(embed=embed)
+    return embed
+
+
+# Built once and reused, like the shared error embeds in cogs/smogon.py
+HELP_EMBED = build_help_embed()
+
+
+@bot.hybrid_command(name="help", description="Show bot commands and usage")
+async def help_command(ctx: commands.Context):
+    """Display help information"""
+    await ctx.send(embed=HELP_EMBED)
 
 
 @bot.hybrid_command(name="ping", description="Check bot latency and response time")
 async def ping(ctx: commands.Context):
     """Check bot's latency"""
-    import time
-
     # WebSocket latency
-    ws_latency = round(bot.latency * 1000, 2)
+    ws_latency = bot.get_latency_ms()
 
     if ctx.interaction:
         # Slash command - ephemeral
-        start_time = time.perf_counter()
+        start_ns = time.monotonic_ns()
         await ctx.defer(ephemeral=True)
-        api_latency = round((time.perf_counter() - start_time) * 1000, 2)
+        api_latency = (time.monotonic_ns() - start_ns) // 1_000_000
 
-        embed = discord.Embed(color=0x2B2D31)
+        embed = discord.Embed(color=COLOR_NEUTRAL)
         embed.add_field(
             name="WebSocket Latency", value=f"```{ws_latency} ms```", inline=True
         )
@@ -945,16 +1311,16 @@ async def ping(ctx: commands.Context):
         await ctx.send(embed=embed)
     else:
         # Prefix command - normal message
-        start_time = time.perf_counter()
+        start_ns = time.monotonic_ns()
 
-        embed = discord.Embed(color=0x2B2D31)
+        embed = discord.Embed(color=COLOR_NEUTRAL)
         embed.add_field(
             name="WebSocket Latency", value=f"```{ws_latency} ms```", inline=True
         )
         embed.add_field(name="API Response Time", value="```...```", inline=True)
 
         msg = await ctx.send(embed=embed)
-        api_latency = round((time.perf_counter() - start_time) * 1000, 2)
+        api_latency = (time.monotonic_ns() - start_ns) // 1_000_000
 
         # Update with actual API latency
         embed.set_field_at(
@@ -976,25 +1342,29 @@ async def uptime(interaction: discord.Interaction):
     if bot.start_time:
         uptime_seconds = int(time.time() - bot.start_time)
 
-        days, remainder = divmod(uptime_seconds, 86400)
-        hours, remainder = divmod(remainder, 3600)
-        minutes, seconds = divmod(remainder, 60)
-
-        uptime_parts = []
-        if days > 0:
-            uptime_parts.append(f"{days}d")
-        if hours > 0:
-            uptime_parts.append(f"{hours}h")
-        if minutes > 0:
-            uptime_parts.append(f"{minutes}m")
-        uptime_parts.append(f"{seconds}s")
+        seconds = uptime_seconds % SECONDS_PER_MINUTE
 
-        uptime_str = " ".join(uptime_parts)
+        # Fixed template, dropping only the leading zero components; each
+        # tier decomposes only the units it prints
+        if uptime_seconds < SECONDS_PER_MINUTE:
+            uptime_str = f"{seconds}s"
+        elif uptime_seconds < SECONDS_PER_HOUR:
+            minutes = uptime_seconds // SECONDS_PER_MINUTE
+            uptime_str = f"{minutes}m {seconds}s"
+        else:
+            minutes = uptime_seconds % SECONDS_PER_HOUR // SECONDS_PER_MINUTE
+            if uptime_seconds < SECONDS_PER_DAY:
+                hours = uptime_seconds // SECONDS_PER_HOUR
+                uptime_str = f"{hours}h {minutes}m {seconds}s"
+            else:
+                days = uptime_seconds // SECONDS_PER_DAY
+                hours = uptime_seconds % SECONDS_PER_DAY // SECONDS_PER_HOUR
+                uptime_str = f"{days}d {hours}h {minutes}m {seconds}s"
 
         embed = discord.Embed(
             title="⏰ Bot Uptime",
             description=f"```{uptime_str}```",
-            color=0x00FF00,
+            color=COLOR_GREEN,
             timestamp=interaction.created_at,
         )
 
@@ -1012,13 +1382,13 @@ async def status(interaction: discord.Interaction):
     """Check bot's current health and system status"""
 
     # Get latency
-    ws_latency_ms = round(bot.latency * 1000, 2)
+    ws_latency_ms = bot.get_latency_ms()
 
     # Determine health status based on latency
     if ws_latency_ms < HEALTHY_LATENCY_MS:
         status_emoji = "🟢"
         status_text = "Healthy"
-        color = 0x00FF00
+        color = COLOR_GREEN
     elif ws_latency_ms < WARNING_LATENCY_MS:
         status_emoji = "🟡"
         status_text = "Warning"
@@ -1044,19 +1414,19 @@ async def status(interaction: discord.Interaction):
 
     # Guild/User count
     guild_count = len(bot.guilds)
-    user_count = sum(g.member_count for g in bot.guilds if g.member_count)
+    user_count = bot.get_user_count_str()
     embed.add_field(
         name="🌐 Reach",
-        value=f"```{guild_count} servers\n{user_count:,} users```",
+        value=f"```{guild_count} servers\n{user_count} users```",
         inline=True,
     )
 
     # Uptime
     if bot.start_time:
         uptime_seconds = int(time.time() - bot.start_time)
-        days, remainder = divmod(uptime_seconds, 86400)
-        hours, remainder = divmod(remainder, 3600)
-        minutes, _ = divmod(remainder, 60)
+        days = uptime_seconds // SECONDS_PER_DAY
+        hours = uptime_seconds % SECONDS_PER_DAY // SECONDS_PER_HOUR
+        minutes = uptime_seconds % SECONDS_PER_HOUR // SECONDS_PER_MINUTE
 
         uptime_str = f"{days}d {hours}h {minutes}m"
         embed.add_field(
@@ -1066,9 +1436,9 @@ async def status(interaction: discord.Interaction):
         )
 
     # Cache stats (if available)
-    smogon_cog = bot.get_cog("Smogon")
-    if smogon_cog and hasattr(smogon_cog, "api_client"):
-        stats = smogon_cog.api_client.get_cache_stats()
+    api_client = bot.api_clients.get("Smogon")
+    if api_client is not None:
+        stats = api_client.get_cache_stats()
         embed.add_field(
             name="💾 Cache",
             value=f"```{stats['size']}/{stats['max_size']} entries\nHit rate: {stats['hit_rate']}```",
@@ -1077,9 +1447,8 @@ async def status(interaction: discord.Interaction):
 
     # Shiny monitoring (if enabled)
     if TARGET_USER_ID:
-        total_monitored = sum(
-            len(config.channels) for config in bot.shiny_configs.values()
-        )
+        # Channel IDs are globally unique, so the flat set size is the total
+        total_monitored = len(bot.monitored_channel_ids)
         embed.add_field(
             name="🌟 Shiny Watch",
             value=f"```{total_monitored} channels\n{len(bot.shiny_configs)} servers```",
@@ -1095,6 +1464,61 @@ async def status(interaction: discord.Interaction):
     await interaction.response.send_message(embed=embed, ephemeral=True)
 
 
+def _debug_embed_lines(embed: discord.Embed, idx: int) -> Iterator[str]:
+    """Yield the debug report lines for one embed of the inspected message"""
+    yield ""
+    yield f"**═══ Embed {idx} ═══**"
+
+    if embed.title:
+        yield f"**Title:** `{embed.title}`"
+
+    if embed.author:
+        yield f"**Author Name:** `{embed.author.name}`"
+        yield f"**Author Icon:** {embed.author.icon_url or 'None'}"
+
+    if embed.description:
+        desc_preview = truncate_text(embed.description, 200, smart=False)
+        yield f"**Description:**\n```{desc_preview}```"
+
+    if embed.footer:
+        yield f"**Footer Text:** `{embed.footer.text}`"
+
+    if embed.image:
+        yield f"**Image URL:** {truncate_text(embed.image.url, 50, smart=False)}"
+
+    yield ""
+    yield "**🔍 PATTERN TESTS:**"
+
+    author_name = embed.author.name if embed.author else None
+
+    # One probe over every field; per-field searches only run on a hit.
+    # NUL can't be matched by any part of the pattern, so no match can
+    # straddle two fields.
+    probe = "\0".join(
+        text for text in (embed.description, embed.title, author_name) if text
+    )
+    probe_hit = SHINY_PATTERN.search(probe) is not None
+
+    # Test description (PRIMARY CHECK)
+    if embed.description:
+        match = SHINY_PATTERN.search(embed.description) if probe_hit else None
+        yield f"**Description match: `{match is not None}`**"
+        if match:
+            yield f"**✅ SHINY FOUND: `{match.group()}`**"
+        else:
+            yield "❌ No shiny pattern in description"
+
+    # Test title
+    if embed.title:
+        match = SHINY_PATTERN.search(embed.title) if probe_hit else None
+        yield f"Title match: `{match is not None}`"
+
+    # Test author name
+    if author_name:
+        match = SHINY_PATTERN.search(author_name) if probe_hit else None
+        yield f"Author.name match: `{match is not None}`"
+
+
 @bot.tree.command(
     name="debug-message",
     description="Debug the last message from target user (Owner only)",
@@ -1107,20 +1531,22 @@ async def debug_message(interaction: discord.Interaction):
         return
 
     await interaction.response.defer(ephemeral=True)
-
-    messages = []
-    async for msg in interaction.channel.history(limit=MAX_MESSAGE_HISTORY_FOR_DEBUG):
+    # Every reply after the defer goes through the followup webhook
+    send = interaction.followup.send
+
+    # History is newest first - the first hit is the one we want
+    last_msg = None
+    async for msg in interaction.channel.history(
+        limit=MAX_MESSAGE_HISTORY_FOR_DEBUG, oldest_first=False
+    ):
         if msg.author.id == TARGET_USER_ID:
-            messages.append(msg)
+            last_msg = msg
+            break
 
-    if not messages:
-        await interaction.followup.send(
-            "No messages from target user found!", ephemeral=True
-        )
+    if last_msg is None:
+        await send("No messages from target user found!", ephemeral=True)
         return
 
-    last_msg = messages[0]
-
     debug_info = [
         "**Last Message from Target User**",
         f"Author: {last_msg.author.name} (ID: {last_msg.author.id})",
@@ -1131,83 +1557,67 @@ async def debug_message(interaction: discord.Interaction):
     ]
 
     if last_msg.embeds:
-        for idx, embed in enumerate(last_msg.embeds):
-            debug_info.append("")
-            debug_info.append(f"**═══ Embed {idx + 1} ═══**")
-
-            if embed.title:
-                debug_info.append(f"**Title:** `{embed.title}`")
-
-            if embed.author:
-                debug_info.append(f"**Author Name:** `{embed.author.name}`")
-                debug_info.append(f"**Author Icon:** {embed.author.icon_url or 'None'}")
-
-            if embed.description:
-                desc_preview = embed.description[:200]
-                debug_info.append(f"**Description:**\n```{desc_preview}```")
-
-            if embed.footer:
-                debug_info.append(f"**Footer Text:** `{embed.footer.text}`")
-
-            if embed.image:
-                debug_info.append(f"**Image URL:** {embed.image.url[:50]}...")
-
-            debug_info.append("")
-            debug_info.append("**🔍 PATTERN TESTS:**")
-
-            # Test description (PRIMARY CHECK)
-            if embed.description:
-                match = SHINY_PATTERN.search(embed.description)
-                debug_info.append(f"**Description match: `{match is not None}`**")
-                if match:
-                    debug_info.append(f"**✅ SHINY FOUND: `{match.group()}`**")
-                else:
-                    debug_info.append("❌ No shiny pattern in description")
-
-            # Test title
-            if embed.title:
-                match = SHINY_PATTERN.search(embed.title)
-                debug_info.append(f"Title match: `{match is not None}`")
-
-            # Test author name
-            if embed.author and embed.author.name:
-                match = SHINY_PATTERN.search(embed.author.name)
-                debug_info.append(f"Author.name match: `{match is not None}`")
+        for idx, embed in enumerate(last_msg.embeds, 1):
+            debug_info.extend(_debug_embed_lines(embed, idx))
     else:
         debug_info.append("No embeds!")
 
-    full_text = "\n".join(debug_info)
-
-    # Split into chunks if too long
-    if len(full_text) > 2000:
-        chunks = [full_text[i : i + 2000] for i in range(0, len(full_text), 2000)]
-        for chunk in chunks:
-            await interaction.followup.send(chunk, ephemeral=True)
-    else:
-        await interaction.followup.send(full_text, ephemeral=True)
+    # Paginate on line boundaries into embed-description sized pages
+    paginator = commands.Paginator(
+        prefix=None, suffix=None, max_size=DISCORD_EMBED_DESCRIPTION_LIMIT
+    )
+    for line in debug_info:
+        paginator.add_line(line)
+
+    # Pack as many page embeds per message as Discord allows (count and total
+    # characters); messages are sent in order so the report reads top to bottom
+    batch = []
+    batch_chars = 0
+    for page in paginator.pages:
+        if batch and (
+            len(batch) == DISCORD_EMBEDS_PER_MESSAGE_LIMIT
+            or batch_chars + len(page) > DISCORD_EMBED_TOTAL_LIMIT
+        ):
+            await send(embeds=batch, ephemeral=True)
+            batch = []
+            batch_chars = 0
+        batch.append(discord.Embed(description=page, color=COLOR_NEUTRAL))
+        batch_chars += len(page)
+
+    if batch:
+        await send(embeds=batch, ephemeral=True)
 
 
 async def load_cogs():
     """Load all bot cogs"""
     cogs = ["cogs.smogon"]
-    for cog in cogs:
-        try:
-            await bot.load_extension(cog)
-            logger.info(f"✅ Loaded {cog}")
-        except Exception as e:
-            logger.error(f"❌ Failed to load {cog}: {e}", exc_info=e)
+    results = await asyncio.gather(
+        *(bot.load_extension(cog) for cog in cogs), return_exceptions=True
+    )
+    for cog, result in zip(cogs, results):
+        if isinstance(result, BaseException):
+            logger.error(f"❌ Failed to load {cog}: {result}", exc_info=result)
+        else:
+            logger.info("✅ Loaded %s", cog)
 
 
 async def main():
     """Main bot startup function"""
-    async with bot:
-        await load_cogs()
-        await bot.start(DISCORD_TOKEN)
+    # The shared session outlives the bot so clients can still save on close
+    async with create_http_session() as http_session, bot:
+        bot.http_session = http_session
+        # Overlap the login round-trip with local cog imports; both must be
+        # done before connect() so cog listeners see READY
+        await asyncio.gather(bot.login(DISCORD_TOKEN), load_cogs())
+        await bot.connect()
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
     except Exception as e:
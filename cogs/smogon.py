@@ -2,8 +2,9 @@ import sys
 
 sys.path.append("..")
 
+import copy
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 import discord
 from discord.ext import commands
@@ -44,19 +45,67 @@ from utils.validators import (
 
 logger = logging.getLogger("smogon_bot.smogon")
 
+# PokeAPI stat key -> short label, in display order
+STAT_ABBREVIATIONS = (
+    ("hp", "HP"),
+    ("attack", "Atk"),
+    ("defense", "Def"),
+    ("special-attack", "SpA"),
+    ("special-defense", "SpD"),
+    ("speed", "Spe"),
+)
+
+# Fallback error embeds with fixed text, built once and shared. Sending an
+# embed only serializes it (to_dict), so one instance can back any number of
+# sends - as long as nothing mutates it after it is built
+SEARCH_ERROR_EMBED = create_error_embed(
+    "Error", "An error occurred while searching. Please try again later."
+)
+GENERIC_ERROR_EMBED = create_error_embed(
+    "Error", "An error occurred. Please try again later."
+)
+GENERATION_SWITCH_ERROR_EMBED = create_error_embed(
+    "Error", "An error occurred while switching generations."
+)
+
+# Generation selector options never change apart from which one is the
+# default, so views copy these instead of rebuilding them
+GENERATION_OPTION_TEMPLATES = tuple(
+    discord.SelectOption(
+        label=f"Generation {i}",
+        value=f"gen{i}",
+        description=f"Switch to Gen {i}",
+        emoji="🎮",
+    )
+    for i in range(1, MAX_GENERATION + 1)
+)
+
 
 class Smogon(commands.Cog):
     """Cog for fetching Smogon competitive sets and Pokemon data"""
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.api_client = SmogonAPIClient()
+        # Share the bot's pooled HTTP session when it provides one
+        self.api_client = SmogonAPIClient(session=getattr(bot, "http_session", None))
 
     def cog_unload(self):
         """Cleanup when cog is unloaded"""
         self.bot.loop.create_task(self.api_client.close())
         logger.info("Smogon cog unloaded")
 
+    async def _validated_pokemon(
+        self, ctx: commands.Context, pokemon: str
+    ) -> Optional[str]:
+        """Sanitize and validate a Pokemon name, replying with the error if invalid"""
+        pokemon = sanitize_input(pokemon)
+        is_valid, error_msg = validate_pokemon_name(pokemon)
+        if not is_valid:
+            embed = create_error_embed("Invalid Pokemon Name", error_msg)
+            await ctx.send(embed=embed)
+            return None
+        return pokemon
+
     @commands.hybrid_command(
         name="smogon",
         description="Get competitive movesets from Smogon University",
@@ -87,11 +136,8 @@ class Smogon(commands.Cog):
     ):
         """Process the smogon command logic with validation"""
 
-        pokemon = sanitize_input(pokemon)
-        is_valid, error_msg = validate_pokemon_name(pokemon)
-        if not is_valid:
-            embed = create_error_embed("Invalid Pokemon Name", error_msg)
-            await ctx.send(embed=embed)
+        pokemon = await self._validated_pokemon(ctx, pokemon)
+        if pokemon is None:
             return
 
         is_valid, error_msg, gen_normalized = validate_generation(generation)
@@ -171,16 +217,12 @@ class Smogon(commands.Cog):
                     extra={"pokemon": pokemon, "generation": gen_normalized},
                     exc_info=True,
                 )
-                embed = create_error_embed(
-                    "Error",
-                    "An error occurred while searching. Please try again later.",
-                )
-                await ctx.send(embed=embed)
+                await ctx.send(embed=SEARCH_ERROR_EMBED)
                 return
 
-        first_format = list(all_formats.keys())[0]
+        first_format = next(iter(all_formats))
         first_format_sets = all_formats[first_format]
-        first_set_name = list(first_format_sets.keys())[0]
+        first_set_name = next(iter(first_format_sets))
 
         embed = self.create_set_embed(
             pokemon,
@@ -220,11 +262,8 @@ class Smogon(commands.Cog):
     async def _process_ev_command(self, ctx: commands.Context, pokemon: str):
         """Process the EV yield command logic with validation"""
 
-        pokemon = sanitize_input(pokemon)
-        is_valid, error_msg = validate_pokemon_name(pokemon)
-        if not is_valid:
-            embed = create_error_embed("Invalid Pokemon Name", error_msg)
-            await ctx.send(embed=embed)
+        pokemon = await self._validated_pokemon(ctx, pokemon)
+        if pokemon is None:
             return
 
         try:
@@ -247,33 +286,21 @@ class Smogon(commands.Cog):
                 extra={"pokemon": pokemon},
                 exc_info=True,
             )
-            embed = create_error_embed(
-                "Error",
-                "An error occurred. Please try again later.",
-            )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=GENERIC_ERROR_EMBED)
 
     def create_ev_embed(self, pokemon_name: str, ev_data: dict) -> discord.Embed:
         """Create Discord embed for EV yield"""
         pokemon_display = capitalize_pokemon_name(pokemon_name)
         ev_yields = ev_data["ev_yields"]
 
-        ev_parts = []
-        stat_abbrev = {
-            "hp": "HP",
-            "attack": "Atk",
-            "defense": "Def",
-            "special-attack": "SpA",
-            "special-defense": "SpD",
-            "speed": "Spe",
-        }
-
-        for stat_key, stat_short in stat_abbrev.items():
-            effort = ev_yields.get(stat_key, 0)
-            if effort > 0:
-                ev_parts.append(f"+{effort} {stat_short}")
-
-        ev_string = ", ".join(ev_parts) if ev_parts else "No EVs"
+        ev_string = (
+            ", ".join(
+                f"+{ev_yields[stat_key]} {stat_short}"
+                for stat_key, stat_short in STAT_ABBREVIATIONS
+                if ev_yields.get(stat_key, 0) > 0
+            )
+            or "No EVs"
+        )
 
         embed = discord.Embed(
             title=pokemon_display,
@@ -308,11 +335,8 @@ class Smogon(commands.Cog):
     ):
         """Process the sprite command logic with validation"""
 
-        pokemon = sanitize_input(pokemon)
-        is_valid, error_msg = validate_pokemon_name(pokemon)
-        if not is_valid:
-            embed = create_error_embed("Invalid Pokemon Name", error_msg)
-            await ctx.send(embed=embed)
+        pokemon = await self._validated_pokemon(ctx, pokemon)
+        if pokemon is None:
             return
 
         shiny_bool = shiny.lower() in ["yes", "y", "true", "1", "shiny"]
@@ -361,11 +385,7 @@ class Smogon(commands.Cog):
                 },
                 exc_info=True,
             )
-            embed = create_error_embed(
-                "Error",
-                "An error occurred. Please try again later.",
-            )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=GENERIC_ERROR_EMBED)
 
     def create_sprite_embed(
         self, pokemon_name: str, sprite_data: dict
@@ -481,6 +501,26 @@ class Smogon(commands.Cog):
 class SetSelectorView(discord.ui.View):
     """Interactive view with dropdowns for generation, format, and set selection"""
 
+    # discord.ui.View keeps its own state in __dict__; only this view's
+    # fields go in slots
+    __slots__ = (
+        "pokemon",
+        "all_formats",
+        "generation",
+        "current_format",
+        "current_sets",
+        "api_client",
+        "cog",
+        "author_id",
+        "current_set_index",
+        "set_names",
+        "set_embeds",
+        "message",
+        "generation_select",
+        "format_select",
+        "set_select",
+    )
+
     def __init__(
         self,
         pokemon: str,
@@ -497,15 +537,22 @@ class SetSelectorView(discord.ui.View):
         self.all_formats = all_formats
         self.generation = generation
         self.current_format = current_format
+        self.current_sets: Dict[str, dict] = {}
         self.api_client = api_client
         self.cog = cog
         self.author_id = author_id
         self.current_set_index = 0
+        self.set_names: List[str] = []
+        self.select_format(current_format)
+        # Built set embeds by (generation, format, set index), reused when
+        # flipping back to a set (see the shared error embeds above)
+        self.set_embeds: Dict[Tuple[str, str, int], discord.Embed] = {}
         self.message: Optional[discord.Message] = None
 
-        self.add_generation_selector()
-        self.add_format_selector()
-        self.add_set_selector()
+        # Selectors are created once; callbacks update their options in place
+        self.generation_select = self.add_generation_selector()
+        self.format_select = self.add_format_selector()
+        self.set_select = self.add_set_selector()
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         """Check if the user interacting is the command author"""
@@ -516,18 +563,11 @@ class SetSelectorView(discord.ui.View):
             return False
         return True
 
-    def add_generation_selector(self):
+    def add_generation_selector(self) -> discord.ui.Select:
         """Add generation selector dropdown"""
-        options = [
-            discord.SelectOption(
-                label=f"Generation {i}",
-                value=f"gen{i}",
-                description=f"Switch to Gen {i}",
-                emoji="🎮",
-                default=(f"gen{i}" == self.generation),
-            )
-            for i in range(1, MAX_GENERATION + 1)
-        ]
+        options = [copy.copy(option) for option in GENERATION_OPTION_TEMPLATES]
+        for option in options:
+            option.default = option.value == self.generation
 
         select = discord.ui.Select(
             placeholder="🎮 Select Generation",
@@ -537,9 +577,10 @@ class SetSelectorView(discord.ui.View):
         )
         select.callback = self.generation_callback
         self.add_item(select)
+        return select
 
-    def add_format_selector(self):
-        """Add format selector dropdown"""
+    def build_format_options(self) -> List[discord.SelectOption]:
+        """Build format options for the current generation's formats"""
         options = []
 
         for tier in self.all_formats.keys():
@@ -555,21 +596,23 @@ class SetSelectorView(discord.ui.View):
                 )
             )
 
+        return options
+
+    def add_format_selector(self) -> discord.ui.Select:
+        """Add format selector dropdown"""
         select = discord.ui.Select(
             placeholder="📋 Select Format",
-            options=options,
+            options=self.build_format_options(),
             custom_id="format_select",
             row=1,
         )
         select.callback = self.format_callback
         self.add_item(select)
+        return select
 
-    def add_set_selector(self):
-        """Add set selector dropdown"""
-        current_sets = self.all_formats[self.current_format]
-        set_names = list(current_sets.keys())
-
-        display_sets = set_names[:25]
+    def build_set_options(self) -> List[discord.SelectOption]:
+        """Build set options for the current format"""
+        display_sets = self.set_names[:25]
 
         options = []
         for idx, set_name in enumerate(display_sets):
@@ -583,19 +626,72 @@ class SetSelectorView(discord.ui.View):
                 )
             )
 
-        if len(set_names) > 25:
-            placeholder = f"⚔️ Select Set (Showing 25/{len(set_names)} sets)"
-        else:
-            placeholder = "⚔️ Select Moveset"
+        return options
+
+    def get_set_placeholder(self) -> str:
+        """Placeholder for the set selector, noting when sets are truncated"""
+        set_count = len(self.set_names)
+        if set_count > 25:
+            return f"⚔️ Select Set (Showing 25/{set_count} sets)"
+        return "⚔️ Select Moveset"
 
+    def add_set_selector(self) -> discord.ui.Select:
+        """Add set selector dropdown"""
         select = discord.ui.Select(
-            placeholder=placeholder,
-            options=options,
+            placeholder=self.get_set_placeholder(),
+            options=self.build_set_options(),
             custom_id="set_select",
             row=2,
         )
         select.callback = self.set_callback
         self.add_item(select)
+        return select
+
+    def select_format(self, tier: str):
+        """Switch to a format, caching its sets and their names for the callbacks"""
+        self.current_format = tier
+        self.current_sets = self.all_formats[tier]
+        self.set_names = list(self.current_sets)
+
+    @staticmethod
+    def mark_default(select: discord.ui.Select, value: str):
+        """Move the selected (default) flag onto the option with this value"""
+        for option in select.options:
+            option.default = option.value == value
+
+    def refresh_format_and_sets(self):
+        """Rebuild the format and set options after the generation changes"""
+        self.format_select.options = self.build_format_options()
+        self.refresh_sets()
+
+    def refresh_sets(self):
+        """Rebuild the set options after the format changes"""
+        self.set_select.options = self.build_set_options()
+        self.set_select.placeholder = self.get_set_placeholder()
+
+    def get_current_set_embed(self) -> discord.Embed:
+        """
+        Build the embed for the selected set, reusing it on repeat visits
+
+        The same Embed is returned on every edit, so callers must not mutate
+        it (e.g. with validate_and_truncate_embed - create_set_embed already
+        has).
+        """
+        key = (self.generation, self.current_format, self.current_set_index)
+        embed = self.set_embeds.get(key)
+        if embed is None:
+            set_name = self.set_names[self.current_set_index]
+            embed = self.cog.create_set_embed(
+                self.pokemon,
+                set_name,
+                self.current_sets[set_name],
+                self.generation,
+                self.current_format,
+                current_set_index=self.current_set_index,
+                total_sets=len(self.set_names),
+            )
+            self.set_embeds[key] = embed
+        return embed
 
     async def generation_callback(self, interaction: discord.Interaction):
         """Handle generation dropdown selection"""
@@ -619,26 +715,13 @@ class SetSelectorView(discord.ui.View):
 
             self.generation = selected_gen
             self.all_formats = new_formats
-            self.current_format = list(new_formats.keys())[0]
+            self.select_format(next(iter(new_formats)))
             self.current_set_index = 0
 
-            self.clear_items()
-            self.add_generation_selector()
-            self.add_format_selector()
-            self.add_set_selector()
+            self.mark_default(self.generation_select, selected_gen)
+            self.refresh_format_and_sets()
 
-            first_format_sets = self.all_formats[self.current_format]
-            first_set_name = list(first_format_sets.keys())[0]
-
-            embed = self.cog.create_set_embed(
-                self.pokemon,
-                first_set_name,
-                first_format_sets[first_set_name],
-                self.generation,
-                self.current_format,
-                current_set_index=0,
-                total_sets=len(first_format_sets),
-            )
+            embed = self.get_current_set_embed()
 
             await interaction.edit_original_response(embed=embed, view=self)
 
@@ -652,35 +735,20 @@ class SetSelectorView(discord.ui.View):
                 },
                 exc_info=True,
             )
-            embed = create_error_embed(
-                "Error",
-                "An error occurred while switching generations.",
+            await interaction.followup.send(
+                embed=GENERATION_SWITCH_ERROR_EMBED, ephemeral=True
             )
-            await interaction.followup.send(embed=embed, ephemeral=True)
 
     async def format_callback(self, interaction: discord.Interaction):
         """Handle format dropdown selection"""
         selected_format = interaction.data["values"][0]
-        self.current_format = selected_format
+        self.select_format(selected_format)
         self.current_set_index = 0
 
-        self.clear_items()
-        self.add_generation_selector()
-        self.add_format_selector()
-        self.add_set_selector()
+        self.mark_default(self.format_select, selected_format)
+        self.refresh_sets()
 
-        format_sets = self.all_formats[selected_format]
-        first_set_name = list(format_sets.keys())[0]
-
-        embed = self.cog.create_set_embed(
-            self.pokemon,
-            first_set_name,
-            format_sets[first_set_name],
-            self.generation,
-            selected_format,
-            current_set_index=0,
-            total_sets=len(format_sets),
-        )
+        embed = self.get_current_set_embed()
 
         await interaction.response.edit_message(embed=embed, view=self)
 
@@ -689,24 +757,9 @@ class SetSelectorView(discord.ui.View):
         selected_index = int(interaction.data["values"][0])
         self.current_set_index = selected_index
 
-        current_sets = self.all_formats[self.current_format]
-        set_names = list(current_sets.keys())
-        selected_set_name = set_names[selected_index]
-
-        self.clear_items()
-        self.add_generation_selector()
-        self.add_format_selector()
-        self.add_set_selector()
-
-        embed = self.cog.create_set_embed(
-            self.pokemon,
-            selected_set_name,
-            current_sets[selected_set_name],
-            self.generation,
-            self.current_format,
-            current_set_index=selected_index,
-            total_sets=len(current_sets),
-        )
+        self.mark_default(self.set_select, str(selected_index))
+
+        embed = self.get_current_set_embed()
 
         await interaction.response.edit_message(embed=embed, view=self)
 
@@ -26,6 +26,20 @@ from utils.decorators import retry_on_error
 logger = logging.getLogger("smogon_bot.api")
 
 
+def create_http_session() -> aiohttp.ClientSession:
+    """
+    Create an aiohttp session configured for the Smogon/PokeAPI clients
+
+    The bot builds one of these for the process lifetime and hands it to every
+    API client, so connections (and TLS sessions) are pooled across cogs.
+    """
+    return aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=API_REQUEST_TIMEOUT),
+        headers={"User-Agent": "Pokemon-Smogon-Discord-Bot/2.0"},
+        connector=aiohttp.TCPConnector(ttl_dns_cache=300),
+    )
+
+
 class SmogonAPIClient:
     """
     Client for fetching competitive sets from Smogon and Pokemon data from PokeAPI
@@ -39,9 +53,11 @@ class SmogonAPIClient:
     - Cache statistics tracking
     """
 
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         self.base_url = SMOGON_SETS_URL
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional[aiohttp.ClientSession] = session
+        # A session passed in is shared and closed by its owner, not by us
+        self._owns_session = session is None
 
         # LRU cache using OrderedDict with thread-safe access
         self.cache: OrderedDict[str, Tuple[Any, float]] = OrderedDict()
@@ -135,11 +151,8 @@ class SmogonAPIClient:
         """Get or create aiohttp session with timeout configuration (thread-safe)"""
         async with self._session_lock:
             if self.session is None or self.session.closed:
-                timeout = aiohttp.ClientTimeout(total=API_REQUEST_TIMEOUT)
-                self.session = aiohttp.ClientSession(
-                    timeout=timeout,
-                    headers={"User-Agent": "Pokemon-Smogon-Discord-Bot/2.0"},
-                )
+                self.session = create_http_session()
+                self._owns_session = True
 
                 # Cancel old cleanup task before creating new one
                 if self._cleanup_task and not self._cleanup_task.done():
@@ -148,8 +161,10 @@ class SmogonAPIClient:
                         await self._cleanup_task
                     except asyncio.CancelledError:
                         pass
+                self._cleanup_task = None
 
-                # Start new cleanup task
+            # Start new cleanup task
+            if self._cleanup_task is None:
                 self._cleanup_task = asyncio.create_task(self._cache_cleanup_loop())
                 logger.info("Started cache cleanup background task")
 
@@ -171,7 +186,7 @@ class SmogonAPIClient:
                 pass
             logger.info("Cancelled cache cleanup task")
 
-        if self.session and not self.session.closed:
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
             logger.info(
                 f"API client session closed (Cache stats - Hits: {self.cache_hits}, Misses: {self.cache_misses})"
@@ -258,12 +273,11 @@ class SmogonAPIClient:
 
         if cached_tiers:
             logger.info(f"Using cached tier locations for {pokemon} in {generation}")
-            result = {}
-            for tier in cached_tiers:
-                sets = await self.get_sets(pokemon, generation, tier)
-                if sets:
-                    result[tier] = sets
-            return result
+            # Fetch the known tiers concurrently (cache hits return immediately)
+            all_sets = await asyncio.gather(
+                *(self.get_sets(pokemon, generation, tier) for tier in cached_tiers)
+            )
+            return {tier: sets for tier, sets in zip(cached_tiers, all_sets) if sets}
 
         # Get available formats for this generation
         available_formats = FORMATS_BY_GEN.get(generation, PRIORITY_FORMATS)
@@ -16,6 +16,7 @@ DISCORD_EMBED_AUTHOR_LIMIT = 256
 DISCORD_EMBED_TOTAL_LIMIT = 6000
 DISCORD_EMBED_FIELD_COUNT_LIMIT = 25
 DISCORD_SELECT_MENU_LIMIT = 25
+DISCORD_EMBEDS_PER_MESSAGE_LIMIT = 10
 
 # API Configuration
 DEFAULT_REQUEST_TIMEOUT = 30
@@ -48,6 +49,8 @@ SHINY_CONFIG_BACKUP_KEEP = 3  # Number of backup files to keep
 MAX_POKEMON_NAME_LENGTH = 50
 MIN_POKEMON_NAME_LENGTH = 1
 POKEMON_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9\-\s]+$")
+# Anything but alphanumerics (str.isalnum), hyphen, underscore or space
+SANITIZE_STRIP_PATTERN = re.compile(r"[^\w\- ]")
 
 # Circuit Breaker Settings
 CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
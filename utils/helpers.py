@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import discord
@@ -10,6 +11,22 @@ from utils.constants import (
 )
 
 
+# Pokemon names that don't follow the hyphenated-title rule
+SPECIAL_POKEMON_NAMES = {
+    "nidoran-f": "Nidoran♀",
+    "nidoran-m": "Nidoran♂",
+    "mr-mime": "Mr. Mime",
+    "mime-jr": "Mime Jr.",
+    "type-null": "Type: Null",
+    "ho-oh": "Ho-Oh",
+    "porygon-z": "Porygon-Z",
+    "jangmo-o": "Jangmo-o",
+    "hakamo-o": "Hakamo-o",
+    "kommo-o": "Kommo-o",
+}
+
+
+@lru_cache(maxsize=2048)
 def capitalize_pokemon_name(name: str) -> str:
     """
     Properly capitalize Pokemon names with special handling
@@ -20,23 +37,9 @@ def capitalize_pokemon_name(name: str) -> str:
     Returns:
         Properly formatted name
     """
-    # Special cases
-    special_cases = {
-        "nidoran-f": "Nidoran♀",
-        "nidoran-m": "Nidoran♂",
-        "mr-mime": "Mr. Mime",
-        "mime-jr": "Mime Jr.",
-        "type-null": "Type: Null",
-        "ho-oh": "Ho-Oh",
-        "porygon-z": "Porygon-Z",
-        "jangmo-o": "Jangmo-o",
-        "hakamo-o": "Hakamo-o",
-        "kommo-o": "Kommo-o",
-    }
-
     name_lower = name.lower()
-    if name_lower in special_cases:
-        return special_cases[name_lower]
+    if name_lower in SPECIAL_POKEMON_NAMES:
+        return SPECIAL_POKEMON_NAMES[name_lower]
 
     # Handle forms (e.g., "landorus-therian" -> "Landorus-Therian")
     parts = name.split("-")
@@ -45,6 +48,7 @@ def capitalize_pokemon_name(name: str) -> str:
     return "-".join(capitalized)
 
 
+@lru_cache(maxsize=1024)
 def format_generation_tier(generation: str, tier: str) -> str:
     """
     Format generation and tier for display
@@ -71,6 +75,7 @@ def format_generation_tier(generation: str, tier: str) -> str:
     return f"Gen {gen_num} {tier_display}"
 
 
+@lru_cache(maxsize=1024)
 def get_format_display_name(tier: str, set_count: Optional[int] = None) -> str:
     """
     Get display name for a format/tier
@@ -272,6 +277,7 @@ def truncate_text(text: str, max_length: int = 1024, smart: bool = True) -> str:
     return text[: max_length - 3] + "..."
 
 
+@lru_cache(maxsize=1024)
 def get_smogon_url(pokemon: str, generation: str, tier: str) -> str:
     """
     Generate Smogon Dex URL for a Pokemon set
@@ -341,19 +347,10 @@ def validate_and_truncate_embed(embed: discord.Embed) -> discord.Embed:
             embed.description, DISCORD_EMBED_DESCRIPTION_LIMIT
         )
 
-    # Check total character count
-    total_chars = 0
-    if embed.title:
-        total_chars += len(embed.title)
-    if embed.description:
-        total_chars += len(embed.description)
-    if embed.footer.text:
-        total_chars += len(embed.footer.text)
-    if embed.author.name:
-        total_chars += len(embed.author.name)
-
-    for field in embed.fields:
-        total_chars += len(field.name) + len(field.value)
+    # Check total character count - Embed.__len__ sums title, description,
+    # fields, footer and author straight from its raw dicts without building
+    # the proxy objects that .fields/.footer/.author return
+    total_chars = len(embed)
 
     # If over limit, we need to remove some fields
     if total_chars > DISCORD_EMBED_TOTAL_LIMIT:
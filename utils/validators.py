@@ -13,6 +13,7 @@ from utils.constants import (
     MAX_POKEMON_NAME_LENGTH,
     MIN_POKEMON_NAME_LENGTH,
     POKEMON_NAME_PATTERN,
+    SANITIZE_STRIP_PATTERN,
 )
 
 
@@ -32,8 +33,9 @@ def sanitize_input(text: str) -> str:
     # Remove leading/trailing whitespace
     text = text.strip()
 
-    # Keep only alphanumeric, hyphens, underscores, and spaces
-    text = "".join(c for c in text if c.isalnum() or c in "-_ ")
+    # Keep only alphanumeric, hyphens, underscores, and spaces (one C-level
+    # pass instead of a per-character generator)
+    text = SANITIZE_STRIP_PATTERN.sub("", text)
 
     return text
 